@@ -0,0 +1,279 @@
+"""Benchmark và kiểm tra tương đương cho contact_scanner.
+
+So sánh contact_scanner với bản clean_text/extract_contact_info cũ (giữ nguyên bên dưới) trên một
+corpus text cố định sinh từ seed, báo lỗi nếu kết quả khác nhau rồi in throughput của hai bản.
+
+    python bench_contact_scanner.py [--docs 2000] [--repeat 9]
+"""
+import argparse
+import os
+import platform
+import random
+import re
+import statistics
+import time
+
+import contact_scanner
+
+
+# ---- Bản cũ trong server.py, giữ nguyên để so sánh ----
+
+def legacy_clean_text(text):
+    """Làm sạch text sau khi trích xuất"""
+    if not text:
+        return text
+    
+    # Loại bỏ các ký tự không mong muốn
+    text = text.replace('\x00', '')
+    text = text.replace('\ufeff', '')
+    
+    # Xử lý các ký tự đặc biệt trong tiếng Việt
+    replacements = {
+        '(cid:264)': 'Đ',
+        '(cid:255)': 'đ',
+        '(cid:105)': 'á',
+        '(cid:106)': 'à',
+        '(cid:107)': 'â',
+        '(cid:109)': 'ã',
+        '(cid:116)': 'í',
+        '(cid:117)': 'ì',
+        '(cid:121)': 'ó',
+        '(cid:122)': 'ò',
+        '(cid:123)': 'ô'
+    }
+    
+    for old, new in replacements.items():
+        text = text.replace(old, new)
+    
+    # Loại bỏ dòng trống thừa và khoảng trắng thừa
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    text = re.sub(r' +', ' ', text)
+    
+    return text.strip()
+
+
+
+def legacy_extract_contact_info(text):
+    """Trích xuất chỉ email và điện thoại từ text"""
+    if not text:
+        return {}
+    
+    info = {}
+    
+    # Làm sạch text trước khi xử lý
+    text = re.sub(r'\s+', ' ', text)
+    
+    # Trích xuất mã số doanh nghiệp để tránh nhầm lẫn với số điện thoại
+    tax_code = ""
+    tax_patterns = [
+        r'Mã số doanh nghiệp:\s*(\d{10})',
+        r'Mã số doanh nghiệp\s*(\d{10})',
+        r'(?:^|\s)(\d{10})(?=\s|$)'
+    ]
+    
+    for pattern in tax_patterns:
+        match = re.search(pattern, text, re.MULTILINE)
+        if match:
+            tax_code = match.group(1)
+            break
+    
+    # 1. Trích xuất điện thoại - Lấy số điện thoại xuất hiện đầu tiên
+    # Tạo pattern tổng hợp để tìm tất cả số điện thoại có thể
+    phone_pattern = r'(?:Điện thoại:\s*|Tel:\s*|Phone:\s*)?(\d{2,4}[\.\-\s]?\d{3,4}[\.\-\s]?\d{3,4}[\.\-\s]?\d{0,4}|\d{9,11})'
+    
+    # Tìm tất cả match với vị trí xuất hiện
+    phone_matches = []
+    for match in re.finditer(phone_pattern, text, re.MULTILINE | re.IGNORECASE):
+        phone_candidate = match.group(1)
+        position = match.start()
+        phone_matches.append((position, phone_candidate))
+    
+    # Sắp xếp theo vị trí xuất hiện
+    phone_matches.sort(key=lambda x: x[0])
+    
+    # Kiểm tra từng số theo thứ tự xuất hiện
+    for position, phone in phone_matches:
+        clean_phone = re.sub(r'[\.\-\s]', '', phone)
+        
+        # Tránh nhầm lẫn với mã số thuế
+        if clean_phone == tax_code:
+            continue
+
+        if tax_code and (clean_phone.startswith(tax_code) or tax_code.startswith(clean_phone)):
+            continue
+
+        # Kiểm tra độ dài và prefix hợp lệ
+        if len(clean_phone) >= 9 and len(clean_phone) <= 11:
+            # Kiểm tra các đầu số hợp lệ của Việt Nam
+            valid_prefixes = [
+                '01', '02', '03', '05', '07', '08', '09',  # Di động
+                '024', '028', '0236', '0256', '0274', '0204',  # Cố định
+                '84'  # Mã quốc gia
+            ]
+            
+            # Kiểm tra xem số có bắt đầu bằng prefix hợp lệ không
+            is_valid = False
+            for prefix in valid_prefixes:
+                if clean_phone.startswith(prefix):
+                    is_valid = True
+                    break
+            
+            # Hoặc kiểm tra nếu là số cố định bắt đầu bằng 0 và có 10-11 chữ số
+            if not is_valid and clean_phone.startswith('0') and len(clean_phone) in [10, 11]:
+                is_valid = True
+            
+            if is_valid:
+                info['phone'] = phone
+                break
+    
+    # 2. Trích xuất email
+    email_patterns = [
+        r'Email:\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+        r'Email\s*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})',
+        r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+    ]
+    
+    for pattern in email_patterns:
+        matches = re.findall(pattern, text)
+        if matches:
+            for email in matches:
+                if '@' in email and '.' in email:
+                    info['email'] = email
+                    break
+            if 'email' in info:
+                break
+    
+    return info
+
+
+
+# ---- Corpus ----
+
+FILLER_WORDS = [
+    'CỘNG', 'HÒA', 'XÃ', 'HỘI', 'CHỦ', 'NGHĨA', 'VIỆT', 'NAM', 'GIẤY', 'ĐỀ', 'NGHỊ', 'đăng', 'ký',
+    'doanh', 'nghiệp', 'công', 'ty', 'TNHH', 'cổ', 'phần', 'Địa', 'chỉ', 'trụ', 'sở', 'chính',
+    'Phường', 'Quận', 'Thành', 'phố', 'Hà', 'Nội', 'Hồ', 'Chí', 'Minh', 'Vốn', 'điều', 'lệ',
+    '1.000.000.000', 'đồng', 'Số', '12/2023', 'ngày', '15', 'tháng', '08', 'năm', '2023'
+]
+CID_TOKENS = list(contact_scanner.CID_REPLACEMENTS) + ['(cid:3)', '(cid:999)']
+PHONE_FORMATS = ['{}', '{}.{}.{}', '{} {} {}', '{}-{}-{}']
+PHONE_LABELS = ['', 'Điện thoại: ', 'Tel: ', 'Phone:', 'ĐIỆN THOẠI: ', 'Fax: ']
+EMAIL_LABELS = ['', 'Email: ', 'Email:', 'Email ', 'E-mail: ', 'Email']
+
+
+def random_phone(rng):
+    digits = rng.choice(['0', '84', '1', '02', '09']) + ''.join(rng.choice('0123456789') for _ in range(rng.randint(7, 10)))
+    parts = [digits[:3], digits[3:6], digits[6:]]
+    return rng.choice(PHONE_FORMATS).format(*parts) if len(parts[2]) else digits
+
+
+def random_email(rng):
+    local = ''.join(rng.choice('abcxyz019._-') for _ in range(rng.randint(1, 10)))
+    domain = ''.join(rng.choice('abcmn0-') for _ in range(rng.randint(1, 8)))
+    return f"{local}@{domain}.{rng.choice(['com', 'vn', 'com.vn', 'x', 'COM'])}"
+
+
+def random_whitespace(rng):
+    return rng.choice([' ', ' ', ' ', '  ', '\n', '\n\n', ' \n \n', '\t', '\x00', '\ufeff', '\u00a0'])
+
+
+def make_document(rng):
+    mst = ''.join(rng.choice('0123456789') for _ in range(10))
+    pieces = []
+    for _ in range(rng.randint(20, 200)):
+        roll = rng.random()
+        if roll < 0.03:
+            pieces.append(rng.choice(['Mã số doanh nghiệp: ', 'Mã số doanh nghiệp ', 'Mã số doanh nghiệp:', '']) + mst)
+        elif roll < 0.07:
+            pieces.append(rng.choice(PHONE_LABELS) + random_phone(rng))
+        elif roll < 0.10:
+            pieces.append(rng.choice(EMAIL_LABELS) + random_email(rng))
+        elif roll < 0.14:
+            pieces.append(rng.choice(CID_TOKENS))
+        elif roll < 0.16:
+            pieces.append(mst + rng.choice(['', '-001', '123']))
+        else:
+            pieces.append(rng.choice(FILLER_WORDS))
+        pieces.append(random_whitespace(rng))
+    return ''.join(pieces)
+
+
+def make_corpus(docs, seed=20231018):
+    rng = random.Random(seed)
+    corpus = [make_document(rng) for _ in range(docs)]
+    corpus += [
+        '', ' ', '\n\n', '\x00', '(cid:264)(cid:255)', ' 0101234567 0912345678\t', '\x1c0912.345.678\u00a0',
+        'Email:a@b.comEmail: c@d.com', 'Emailabc@x.com Email x@y.vn', 'Mã số doanh nghiệp0101234567 Mã số doanh nghiệp: 0209876543',
+        'Tel: 0101234567 Phone: 028 3823 4567', 'ĐIỆN THOẠI: 0912 345 678 Email a@b.vn'
+    ]
+    return corpus
+
+
+# ---- Chạy ----
+
+def check_equivalence(corpus):
+    mismatches = 0
+    for text in corpus:
+        cleaned = legacy_clean_text(text)
+        expected = legacy_extract_contact_info(cleaned)
+        checks = [
+            (contact_scanner.clean_text(text), cleaned),
+            (contact_scanner.extract_contact_info(cleaned), expected),
+            (contact_scanner.extract_contact_info(text), legacy_extract_contact_info(text)),
+            (contact_scanner.scan_contact_info(text), expected),
+        ]
+        for actual, wanted in checks:
+            if actual != wanted:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"MISMATCH: {actual!r} != {wanted!r}\n  text: {text[:200]!r}")
+    return mismatches
+
+
+def run_once(func, corpus):
+    started = time.perf_counter()
+    for text in corpus:
+        func(text)
+    return time.perf_counter() - started
+
+
+def compare(legacy, scanner, corpus, repeat):
+    """Chạy xen kẽ hai bản trong từng vòng để nhiễu của máy ảnh hưởng như nhau, trả về thời gian từng vòng"""
+    rounds = []
+    for _ in range(repeat):
+        rounds.append((run_once(legacy, corpus), run_once(scanner, corpus)))
+    return rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--docs', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=9)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs)
+    total_mb = sum(len(text.encode('utf-8')) for text in corpus) / 1e6
+    print(f"Corpus: {len(corpus)} documents, {total_mb:.2f} MB")
+
+    mismatches = check_equivalence(corpus)
+    if mismatches:
+        raise SystemExit(f"{mismatches} mismatches between contact_scanner and the legacy implementation")
+    print("Equivalence: OK")
+
+    rounds = compare(
+        lambda text: legacy_extract_contact_info(legacy_clean_text(text)),
+        contact_scanner.scan_contact_info,
+        corpus,
+        args.repeat
+    )
+    legacy = min(legacy_time for legacy_time, _ in rounds)
+    scanner = min(scanner_time for _, scanner_time in rounds)
+    ratios = sorted(legacy_time / scanner_time for legacy_time, scanner_time in rounds)
+    print(f"Python {platform.python_version()} on {platform.machine()}, {os.cpu_count()} CPU(s), {args.repeat} interleaved rounds")
+    print(f"legacy clean_text + extract_contact_info: {len(corpus) / legacy:8.0f} docs/s ({total_mb / legacy:.2f} MB/s)")
+    print(f"contact_scanner.scan_contact_info:        {len(corpus) / scanner:8.0f} docs/s ({total_mb / scanner:.2f} MB/s)")
+    print(f"Speedup: {statistics.median(ratios):.2f}x median per round (min {ratios[0]:.2f}x, max {ratios[-1]:.2f}x)")
+
+
+if __name__ == '__main__':
+    main()
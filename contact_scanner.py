@@ -0,0 +1,182 @@
+"""Quét email và số điện thoại từ text trích xuất của PDF đăng ký doanh nghiệp.
+
+Các pattern được compile một lần khi import. Kết quả giống hệt cách làm cũ trong server.py
+(clean_text + extract_contact_info); bench_contact_scanner.py giữ bản cũ để so sánh.
+"""
+import re
+
+# Ký tự rác pdfminer để lại trong text
+_STRIP_CHARS = str.maketrans('', '', '\x00\ufeff')
+
+# Ký tự tiếng Việt bị pdfminer trả về dạng (cid:NNN)
+CID_REPLACEMENTS = {
+    '(cid:264)': 'Đ',
+    '(cid:255)': 'đ',
+    '(cid:105)': 'á',
+    '(cid:106)': 'à',
+    '(cid:107)': 'â',
+    '(cid:109)': 'ã',
+    '(cid:116)': 'í',
+    '(cid:117)': 'ì',
+    '(cid:121)': 'ó',
+    '(cid:122)': 'ò',
+    '(cid:123)': 'ô'
+}
+_CID_PATTERN = re.compile('|'.join(re.escape(cid) for cid in CID_REPLACEMENTS))
+
+_BLANK_LINES = re.compile(r'\n\s*\n')
+_SPACES = re.compile(r' +')
+
+# Nhãn mã số doanh nghiệp và email được tìm trong cùng một lượt quét,
+# phần sau nhãn được match riêng để nhãn có dấu ':' được ưu tiên như trước
+_LABEL_PATTERN = re.compile(r'Mã số doanh nghiệp|Email')
+_TAX_LABEL = 'Mã số doanh nghiệp'
+_EMAIL_ADDRESS = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_TAX_AFTER_LABEL = re.compile(r'(:?)\s*(\d{10})')
+_EMAIL_AFTER_LABEL = re.compile(r'(:?)\s*(' + _EMAIL_ADDRESS + ')')
+_BARE_TAX_CODE = re.compile(r'(?:^|\s)(\d{10})(?=\s|$)', re.MULTILINE)
+_BARE_EMAIL = re.compile(_EMAIL_ADDRESS)
+
+# Bản cũ có nhãn tùy chọn (Điện thoại:|Tel:|Phone:) phía trước; nhãn không chứa chữ số
+# nên bỏ đi không đổi số được bắt mà regex khỏi thử nhãn ở mọi vị trí
+_PHONE_PATTERN = re.compile(r'\d{2,4}[\.\-\s]?\d{3,4}[\.\-\s]?\d{3,4}[\.\-\s]?\d{0,4}|\d{9,11}')
+_PHONE_SEPARATORS = re.compile(r'[\.\-\s]')
+
+# Các đầu số hợp lệ của Việt Nam
+VALID_PHONE_PREFIXES = [
+    '01', '02', '03', '05', '07', '08', '09',  # Di động
+    '024', '028', '0236', '0256', '0274', '0204',  # Cố định
+    '84'  # Mã quốc gia
+]
+
+def _build_prefix_trie(prefixes):
+    trie = {}
+    for prefix in prefixes:
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[None] = True
+    return trie
+
+_PHONE_PREFIX_TRIE = _build_prefix_trie(VALID_PHONE_PREFIXES)
+
+def has_valid_phone_prefix(number):
+    """Số có bắt đầu bằng một đầu số trong VALID_PHONE_PREFIXES không"""
+    node = _PHONE_PREFIX_TRIE
+    for char in number:
+        node = node.get(char)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+def _collapse_whitespace(text):
+    """Gom mọi chuỗi khoảng trắng thành một dấu cách như re.sub(r'\\s+', ' ', text), nhanh hơn nhờ str.split"""
+    collapsed = ' '.join(text.split())
+    if not collapsed:
+        return ' ' if text else ''
+    # str.split bỏ khoảng trắng ở hai đầu, giữ lại một dấu cách như re.sub
+    if text[0].isspace():
+        collapsed = ' ' + collapsed
+    if text[-1].isspace():
+        collapsed += ' '
+    return collapsed
+
+def _replace_cid(match):
+    return CID_REPLACEMENTS[match.group(0)]
+
+def clean_text(text):
+    """Làm sạch text sau khi trích xuất"""
+    if not text:
+        return text
+
+    text = _CID_PATTERN.sub(_replace_cid, text.translate(_STRIP_CHARS))
+    text = _BLANK_LINES.sub('\n\n', text)
+    text = _SPACES.sub(' ', text)
+    return text.strip()
+
+def _scan_labels(text):
+    """Một lượt quét nhãn, trả về (mã số doanh nghiệp, email) theo thứ tự ưu tiên nhãn có ':' rồi nhãn không có ':'"""
+    tax_code = tax_code_fallback = None
+    email = email_fallback = None
+    for label in _LABEL_PATTERN.finditer(text):
+        if label.group(0) == _TAX_LABEL:
+            if tax_code is not None:
+                continue
+            match = _TAX_AFTER_LABEL.match(text, label.end())
+            if not match:
+                continue
+            if match.group(1):
+                tax_code = match.group(2)
+            elif tax_code_fallback is None:
+                tax_code_fallback = match.group(2)
+        else:
+            if email is not None:
+                continue
+            match = _EMAIL_AFTER_LABEL.match(text, label.end())
+            if not match:
+                continue
+            if match.group(1):
+                email = match.group(2)
+            elif email_fallback is None:
+                email_fallback = match.group(2)
+        if tax_code is not None and email is not None:
+            break
+    return tax_code or tax_code_fallback, email or email_fallback
+
+def _find_phone(text, tax_code):
+    """Số điện thoại hợp lệ xuất hiện đầu tiên, bỏ qua số trùng hoặc chồng lên mã số thuế"""
+    for match in _PHONE_PATTERN.finditer(text):
+        phone = match.group(0)
+        clean_phone = _PHONE_SEPARATORS.sub('', phone)
+
+        if clean_phone == tax_code:
+            continue
+
+        if tax_code and (clean_phone.startswith(tax_code) or tax_code.startswith(clean_phone)):
+            continue
+
+        if 9 <= len(clean_phone) <= 11:
+            if has_valid_phone_prefix(clean_phone):
+                return phone
+            # Số cố định bắt đầu bằng 0 và có 10-11 chữ số
+            if clean_phone.startswith('0') and len(clean_phone) in (10, 11):
+                return phone
+    return None
+
+def extract_contact_info(text):
+    """Trích xuất chỉ email và điện thoại từ text"""
+    if not text:
+        return {}
+    return _extract_collapsed(_collapse_whitespace(text))
+
+def _extract_collapsed(text):
+    info = {}
+
+    tax_code, email = _scan_labels(text)
+    if tax_code is None:
+        match = _BARE_TAX_CODE.search(text)
+        tax_code = match.group(1) if match else ""
+
+    phone = _find_phone(text, tax_code)
+    if phone is not None:
+        info['phone'] = phone
+
+    if email is None:
+        match = _BARE_EMAIL.search(text)
+        email = match.group(0) if match else None
+    if email is not None:
+        info['email'] = email
+
+    return info
+
+def scan_contact_info(raw_text):
+    """clean_text + extract_contact_info cho text thô từ pdfminer, chỉ chuẩn hóa khoảng trắng một lần"""
+    if not raw_text:
+        return {}
+
+    text = _CID_PATTERN.sub(_replace_cid, raw_text.translate(_STRIP_CHARS))
+    # Khoảng trắng nào cũng bị gom về ' ' nên hai bước chuẩn hóa của clean_text là thừa ở đây
+    text = ' '.join(text.split())
+    return _extract_collapsed(text) if text else {}
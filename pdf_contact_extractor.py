@@ -0,0 +1,139 @@
+"""Trích xuất email và số điện thoại từ PDF đăng ký doanh nghiệp bằng pdfminer.
+
+Tách khỏi server.py để worker của PdfExtractionService (spawn) chỉ phải import pdfminer và
+contact_scanner thay vì cả app. Cấu hình được truyền qua tham số, module không đọc biến môi trường.
+"""
+import io
+import logging
+import time
+
+from pdfminer.high_level import extract_text, extract_pages
+from pdfminer.layout import LAParams, LTContainer, LTText, LTTextBox
+
+from contact_scanner import scan_contact_info
+
+logger = logging.getLogger(__name__)
+
+def configure_worker_logging(level=logging.INFO):
+    """Initializer của process pool: worker spawn không chạy logging.basicConfig của server.py"""
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(message)s')
+
+PDF_TIER_FAST = 'fast'
+PDF_TIER_FULL = 'full'
+
+def pdfminer_laparams(tier=PDF_TIER_FULL):
+    if tier == PDF_TIER_FAST:
+        # Vẫn gom ký tự thành dòng/box như pass đầy đủ nhưng bỏ bước gom box phân cấp và dò text dọc
+        return LAParams(
+            boxes_flow=None,
+            word_margin=0.1,
+            char_margin=2.0,
+            line_margin=0.5,
+            detect_vertical=False
+        )
+    return LAParams(
+        boxes_flow=0.5,
+        word_margin=0.1,
+        char_margin=2.0,
+        line_margin=0.5,
+        detect_vertical=True
+    )
+
+def extract_text_pdfminer(pdf_source, tier=PDF_TIER_FULL):
+    """Trích xuất text từ PDF bằng pdfminer, nhận đường dẫn hoặc bytes PDF"""
+    try:
+        if isinstance(pdf_source, (bytes, bytearray)):
+            pdf_source = io.BytesIO(pdf_source)
+        
+        text = extract_text(pdf_source, laparams=pdfminer_laparams(tier))
+        return text
+    except Exception as e:
+        logger.error(f"Lỗi khi trích xuất với pdfminer: {e}")
+        return None
+
+def render_page_text(page_layout):
+    """Ghép text của một LTPage giống TextConverter: mỗi text box kết thúc bằng \\n, trang kết thúc bằng \\f"""
+    parts = []
+
+    def render(item):
+        if isinstance(item, LTContainer):
+            for child in item:
+                render(child)
+        elif isinstance(item, LTText):
+            parts.append(item.get_text())
+        if isinstance(item, LTTextBox):
+            parts.append('\n')
+
+    render(page_layout)
+    parts.append('\f')
+    return ''.join(parts)
+
+def extract_contact_info_incremental(pdf_source, max_pages=0, tier=PDF_TIER_FULL):
+    """Layout từng trang và quét contact sau mỗi trang, dừng khi đã có phone và email hoặc chạm max_pages"""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        pdf_source = io.BytesIO(pdf_source)
+
+    text = ''
+    contact_info = {}
+    pages = extract_pages(pdf_source, laparams=pdfminer_laparams(tier), maxpages=max_pages)
+    try:
+        for page_number, page_layout in enumerate(pages, start=1):
+            text += render_page_text(page_layout)
+            # Quét lại toàn bộ text đã có để giữ đúng thứ tự ưu tiên như khi trích xuất cả file
+            contact_info = scan_contact_info(text) if text.strip() else {}
+            if contact_info.get('phone') and contact_info.get('email'):
+                logger.info(f"Found phone and email after {page_number} page(s)")
+                break
+    finally:
+        pages.close()
+
+    if not text.strip():
+        return None
+    return contact_info
+
+def extract_contact_info_pass(pdf_source, tier=PDF_TIER_FULL, incremental=True, max_pages=0):
+    """Một pass pdfminer với cấu hình layout của tier, trả về None nếu PDF không có text"""
+    if incremental:
+        return extract_contact_info_incremental(pdf_source, max_pages, tier)
+
+    raw_text = extract_text_pdfminer(pdf_source, tier)
+    if not raw_text or not raw_text.strip():
+        return None
+    return scan_contact_info(raw_text)
+
+def extract_pdf_contact_info_tiered(pdf_source, tiered=True, incremental=True, max_pages=0):
+    """Trích xuất contact theo tier, trả về (contact_info, passes) với passes là [(tier, found, cpu_seconds)]"""
+    if isinstance(pdf_source, (bytes, bytearray)):
+        logger.info(f"Extracting contact info from in-memory PDF ({len(pdf_source)} bytes)")
+    else:
+        logger.info(f"Extracting contact info from PDF: {pdf_source}")
+
+    tiers = [PDF_TIER_FAST, PDF_TIER_FULL] if tiered else [PDF_TIER_FULL]
+    contact_info = None
+    passes = []
+    for tier in tiers:
+        started = time.process_time()
+        try:
+            result = extract_contact_info_pass(pdf_source, tier, incremental, max_pages)
+        except Exception as e:
+            logger.error(f"Error extracting PDF contact info ({tier} pass): {e}")
+            result = None
+        found = bool(result and result.get('phone') and result.get('email'))
+        passes.append((tier, found, time.process_time() - started))
+
+        if result is not None:
+            # Pass đầy đủ đọc đúng thứ tự nên field khác rỗng của nó thắng field của pass nhanh
+            contact_info = {**(contact_info or {}), **{k: v for k, v in result.items() if v}}
+        if found:
+            break
+
+    if contact_info is None:
+        logger.error("No text extracted from PDF")
+    else:
+        logger.info(f"Extracted contact info: {contact_info} (passes: {[tier for tier, _, _ in passes]})")
+    return contact_info, passes
+
+def extract_pdf_contact_info(pdf_source, tiered=True, incremental=True, max_pages=0):
+    """Trích xuất thông tin liên hệ từ PDF (đường dẫn hoặc bytes)"""
+    contact_info, _ = extract_pdf_contact_info_tiered(pdf_source, tiered, incremental, max_pages)
+    return contact_info
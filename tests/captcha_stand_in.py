@@ -0,0 +1,65 @@
+"""Server giả lập API kiểu 2captcha (in.php/res.php) chạy local để test CaptchaSolver và HedgedCaptchaSolver."""
+import itertools
+import time
+from collections import Counter
+
+from aiohttp import web
+
+
+class StandInSolverServer:
+    """Mỗi captcha được coi là giải xong sau solve_seconds; fail=True thì mọi captcha trả ERROR_CAPTCHA_UNSOLVABLE"""
+    def __init__(self, name, solve_seconds=1.0, fail=False, balance=1.5):
+        self.name = name
+        self.solve_seconds = solve_seconds
+        self.fail = fail
+        self.balance = balance
+        self.submitted = []
+        self.polls = Counter()
+        self._submitted_at = {}
+        self._ids = itertools.count(1000)
+        self._runner = None
+        self.base_url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post('/in.php', self._in_php)
+        app.router.add_get('/res.php', self._res_php)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+        return self
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _in_php(self, request):
+        await request.post()
+        captcha_id = str(next(self._ids))
+        self.submitted.append(captcha_id)
+        self._submitted_at[captcha_id] = time.monotonic()
+        return web.json_response({'status': 1, 'request': captcha_id})
+
+    def _result(self, captcha_id):
+        self.polls[captcha_id] += 1
+        if captcha_id not in self._submitted_at:
+            return 'ERROR_WRONG_CAPTCHA_ID'
+        if self.fail:
+            return 'ERROR_CAPTCHA_UNSOLVABLE'
+        if time.monotonic() - self._submitted_at[captcha_id] < self.solve_seconds:
+            return 'CAPCHA_NOT_READY'
+        return f"TOKEN-{self.name}-{captcha_id}"
+
+    async def _res_php(self, request):
+        query = request.query
+        if query.get('action') == 'getbalance':
+            return web.json_response({'status': 1, 'request': str(self.balance)})
+        if 'ids' in query:
+            results = [self._result(captcha_id) for captcha_id in query['ids'].split(',')]
+            return web.json_response({'status': 1, 'request': '|'.join(results)})
+        result = self._result(query['id'])
+        return web.json_response({'status': 1 if result.startswith('TOKEN') else 0, 'request': result})
@@ -0,0 +1,16 @@
+import pytest
+
+import server
+
+
+@pytest.fixture
+def make_admission():
+    """Factory tạo AdmissionController riêng cho test, trọng số interactive:bulk = 8:1"""
+    def factory(capacity=1, service_time=60):
+        return server.AdmissionController(
+            capacity,
+            weights={server.PRIORITY_INTERACTIVE: 8, server.PRIORITY_BULK: 1},
+            latency_targets={server.PRIORITY_INTERACTIVE: 60, server.PRIORITY_BULK: 900},
+            default_service_time=service_time
+        )
+    return factory
@@ -0,0 +1,50 @@
+"""Sinh PDF nhỏ (font Helvetica, mỗi trang một danh sách dòng text) để test trích xuất mà không cần file mẫu."""
+
+
+def _escape(line):
+    return line.encode('latin-1').replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def make_pdf(pages):
+    """pages: list các trang, mỗi trang là list dòng text ASCII/latin-1"""
+    objects = [b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>", None]
+    font_id, pages_id = 1, 2
+    kids = []
+    for lines in pages:
+        stream = b"BT /F1 12 Tf 50 750 Td 14 TL " + b" ".join(b"(" + _escape(line) + b") '" for line in lines) + b" ET"
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>" % (pages_id, font_id, len(objects))
+        )
+        kids.append(len(objects))
+    objects[pages_id - 1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+    objects.append(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+    catalog_id = len(objects)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for object_id, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (object_id, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog_id, xref)
+    return bytes(out)
+
+
+def registration_pdf(contact_page=1, pages=4):
+    """PDF giống giấy đăng ký: MST ở trang 1, email và điện thoại ở trang contact_page (1-based), còn lại là text đệm"""
+    content = []
+    for page_number in range(1, pages + 1):
+        lines = [f"Trang {page_number}", "Noi dung dang ky kinh doanh"]
+        if page_number == 1:
+            lines.append("Ma so doanh nghiep: 0100109106")
+        if page_number == contact_page:
+            lines += ["Dien thoai: 024 3825 1234", "Email: lienhe@congtyabc.vn"]
+        content.append(lines)
+    return make_pdf(content)
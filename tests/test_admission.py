@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from starlette.testclient import TestClient
+
+import server
+
+
+async def hold(admission, priority, order, started=None, release=None, reject=False):
+    async with admission.slot(priority, reject=reject):
+        order.append(priority)
+        if started:
+            started.set()
+        if release:
+            await release.wait()
+
+
+def test_interactive_overtakes_queued_bulk(make_admission):
+    async def scenario():
+        admission = make_admission(capacity=1)
+        order = []
+        started, release = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(admission, server.PRIORITY_BULK, order, started, release))
+        await started.wait()
+
+        waiters = [asyncio.create_task(hold(admission, server.PRIORITY_BULK, order)) for _ in range(3)]
+        await asyncio.sleep(0)
+        waiters += [asyncio.create_task(hold(admission, server.PRIORITY_INTERACTIVE, order)) for _ in range(2)]
+        await asyncio.sleep(0)
+        assert admission.stats()["waiting"] == {server.PRIORITY_INTERACTIVE: 2, server.PRIORITY_BULK: 3}
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        # Trọng số 8:1 nên cả hai request interactive vào trước các bulk xếp hàng sớm hơn
+        assert order == [server.PRIORITY_BULK] + [server.PRIORITY_INTERACTIVE] * 2 + [server.PRIORITY_BULK] * 3
+        assert admission.in_use == 0
+
+    asyncio.run(scenario())
+
+
+def test_bulk_is_not_starved_by_interactive(make_admission):
+    async def scenario():
+        admission = make_admission(capacity=1)
+        order = []
+        started, release = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(admission, server.PRIORITY_INTERACTIVE, order, started, release))
+        await started.wait()
+
+        waiters = [asyncio.create_task(hold(admission, server.PRIORITY_BULK, order))]
+        waiters += [asyncio.create_task(hold(admission, server.PRIORITY_INTERACTIVE, order)) for _ in range(20)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(holder, *waiters)
+
+        assert order.index(server.PRIORITY_BULK) <= 9
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak_its_slot(make_admission):
+    async def scenario():
+        admission = make_admission(capacity=1)
+        started, release = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(admission, server.PRIORITY_BULK, [], started, release))
+        await started.wait()
+
+        waiter = asyncio.create_task(hold(admission, server.PRIORITY_INTERACTIVE, []))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        await asyncio.gather(holder, waiter, return_exceptions=True)
+
+        assert admission.in_use == 0
+        assert admission.stats()["waiting"][server.PRIORITY_INTERACTIVE] == 0
+
+    asyncio.run(scenario())
+
+
+def test_check_rejects_over_latency_target_with_retry_after(make_admission):
+    async def scenario():
+        admission = make_admission(capacity=2, service_time=45)
+        admission.latency_targets[server.PRIORITY_INTERACTIVE] = 20
+        admission.check(server.PRIORITY_INTERACTIVE)
+        admission.in_use = 2
+
+        with pytest.raises(server.AdmissionRejected) as excinfo:
+            admission.check(server.PRIORITY_INTERACTIVE)
+
+        # Hết slot, không ai xếp hàng trước: chờ một service time chia cho capacity
+        assert excinfo.value.retry_after == 23
+        assert admission.rejected[server.PRIORITY_INTERACTIVE] == 1
+        # Bulk có latency target dài hơn nên vẫn được nhận
+        admission.check(server.PRIORITY_BULK)
+
+    asyncio.run(scenario())
+
+
+def test_combined_info_returns_429_with_retry_after(monkeypatch, make_admission):
+    async def no_cache(keyword):
+        return None
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("rejected lookup must not run")
+
+    admission = make_admission(capacity=1, service_time=90)
+    admission.latency_targets[server.PRIORITY_INTERACTIVE] = 10
+    admission.in_use = 1
+    monkeypatch.setattr(server, "admission", admission)
+    monkeypatch.setattr(server, "lookup_flights", server.SingleFlight())
+    monkeypatch.setattr(server.company_cache, "get", no_cache)
+    monkeypatch.setattr(server, "_lookup_combined_info", fail)
+
+    response = TestClient(server.app).get("/combined-info", params={"keyword": "Cong ty ABC"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "90"
+    assert response.json()["retry_after"] == 90
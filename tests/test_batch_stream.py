@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+import pytest
+from starlette.testclient import TestClient
+
+import server
+
+
+@pytest.fixture
+def fake_lookups(monkeypatch):
+    """Thay pipeline tra cứu bằng coroutine trả về keyword, ghi lại thứ tự các lần gọi"""
+    calls = []
+
+    async def fake_lookup(keyword, refresh=False, priority=None, reject=True):
+        calls.append((keyword, priority, reject))
+        await asyncio.sleep(0.01)
+        return {"keyword": keyword, "status": "success"}, 200
+
+    monkeypatch.setattr(server, "get_combined_info_internal", fake_lookup)
+    return calls
+
+
+def read_lines(response):
+    return sorted((json.loads(line) for line in response.text.splitlines()), key=lambda line: line["index"])
+
+
+def test_ndjson_body_is_parsed_line_by_line(fake_lookups):
+    body = '"0100109106"\n{"keyword": "Cong ty ABC"}\n\nCong ty XYZ\n{not json\n[1, 2]\n'
+    response = TestClient(server.app).post(
+        "/combined-info/batch/stream?concurrency=2", content=body.encode(),
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    lines = read_lines(response)
+    assert [line["index"] for line in lines] == [0, 1, 2, 3, 4]
+    assert [line["status_code"] for line in lines] == [200, 200, 200, 400, 400]
+    assert [line["input"] for line in lines[:3]] == ["0100109106", "Cong ty ABC", "Cong ty XYZ"]
+    assert all(priority == server.PRIORITY_BULK and not reject for _, priority, reject in fake_lookups)
+
+
+def test_ndjson_body_is_consumed_in_chunks(fake_lookups):
+    def chunks():
+        # Dòng bị cắt ngang giữa các chunk
+        yield b'"01001'
+        yield b'09106"\nCong ty'
+        yield b' ABC'
+
+    response = TestClient(server.app).post("/combined-info/batch/stream", content=chunks())
+
+    assert [line["input"] for line in read_lines(response)] == ["0100109106", "Cong ty ABC"]
+
+
+def test_overlong_line_is_reported_and_skipped(fake_lookups, monkeypatch):
+    monkeypatch.setattr(server, "BATCH_MAX_LINE_BYTES", 16)
+    body = b"x" * 40 + b"\nCong ty ABC\n"
+
+    response = TestClient(server.app).post("/combined-info/batch/stream", content=body)
+
+    lines = read_lines(response)
+    assert [line["status_code"] for line in lines] == [400, 200]
+    assert lines[1]["input"] == "Cong ty ABC"
+    assert [keyword for keyword, _, _ in fake_lookups] == ["Cong ty ABC"]
+
+
+def test_json_batch_still_accepts_items(fake_lookups):
+    response = TestClient(server.app).post(
+        "/combined-info/batch", json={"items": ["0100109106", " "], "concurrency": 2}
+    )
+
+    lines = read_lines(response)
+    assert [line["status_code"] for line in lines] == [200, 400]
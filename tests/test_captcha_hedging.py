@@ -0,0 +1,129 @@
+import asyncio
+import time
+
+import pytest
+
+import server
+from tests.captcha_stand_in import StandInSolverServer
+
+
+def make_provider(stand_in):
+    return server.CaptchaSolver(
+        'test-key',
+        base_url=stand_in.base_url,
+        poll_interval=0.05,
+        max_polls=200,
+        first_poll_delay=0.05,
+        name=stand_in.name
+    )
+
+
+async def run_with_stand_ins(configs, scenario):
+    stand_ins = [await StandInSolverServer(**config).start() for config in configs]
+    providers = [make_provider(stand_in) for stand_in in stand_ins]
+    try:
+        return await scenario(stand_ins, providers)
+    finally:
+        for provider in providers:
+            await provider.close()
+        for stand_in in stand_ins:
+            await stand_in.stop()
+
+
+def test_hedge_wins_when_primary_is_slow_and_primary_is_abandoned():
+    async def scenario(stand_ins, providers):
+        slow, fast = stand_ins
+        solver = server.HedgedCaptchaSolver(providers, default_hedge_delay=0.3)
+
+        token = await solver.solve_recaptcha('sitekey', 'https://example.test/form')
+
+        assert token.startswith('TOKEN-fast-')
+        assert solver.hedges_sent == 1
+        assert solver.hedge_wins == 1
+        # Provider thua bị hủy: không còn captcha chờ poll và server không nhận thêm lần poll nào
+        await asyncio.sleep(0.1)
+        polls = dict(slow.polls)
+        await asyncio.sleep(0.3)
+        assert providers[0].poller.stats()['pending'] == 0
+        assert dict(slow.polls) == polls
+        assert len(slow.submitted) == 1 and len(fast.submitted) == 1
+
+    asyncio.run(run_with_stand_ins(
+        [{'name': 'slow', 'solve_seconds': 30}, {'name': 'fast', 'solve_seconds': 0.1}],
+        scenario
+    ))
+
+
+def test_no_hedge_when_primary_answers_in_time():
+    async def scenario(stand_ins, providers):
+        solver = server.HedgedCaptchaSolver(providers, default_hedge_delay=5)
+
+        token = await solver.solve_recaptcha('sitekey', 'https://example.test/form')
+
+        assert token.startswith('TOKEN-primary-')
+        assert solver.hedges_sent == 0
+        assert stand_ins[1].submitted == []
+
+    asyncio.run(run_with_stand_ins(
+        [{'name': 'primary', 'solve_seconds': 0.1}, {'name': 'backup', 'solve_seconds': 0.1}],
+        scenario
+    ))
+
+
+def test_failing_primary_hedges_without_waiting_for_the_delay():
+    async def scenario(stand_ins, providers):
+        solver = server.HedgedCaptchaSolver(providers, default_hedge_delay=30)
+        started = time.monotonic()
+
+        token = await solver.solve_recaptcha('sitekey', 'https://example.test/form')
+
+        assert token.startswith('TOKEN-backup-')
+        assert time.monotonic() - started < 5
+        assert solver.stats()['providers'][0]['failures'] == 1
+
+    asyncio.run(run_with_stand_ins(
+        [{'name': 'broken', 'fail': True}, {'name': 'backup', 'solve_seconds': 0.1}],
+        scenario
+    ))
+
+
+def test_cancelling_a_solve_stops_polling_every_provider():
+    async def scenario(stand_ins, providers):
+        solver = server.HedgedCaptchaSolver(providers, default_hedge_delay=0.1)
+        task = asyncio.create_task(solver.solve_recaptcha('sitekey', 'https://example.test/form'))
+        await asyncio.sleep(0.4)
+        assert all(len(stand_in.submitted) == 1 for stand_in in stand_ins)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.1)
+        polls = [dict(stand_in.polls) for stand_in in stand_ins]
+        await asyncio.sleep(0.3)
+        assert [dict(stand_in.polls) for stand_in in stand_ins] == polls
+        assert all(provider.poller.stats()['pending'] == 0 for provider in providers)
+
+    asyncio.run(run_with_stand_ins(
+        [{'name': 'a', 'solve_seconds': 30}, {'name': 'b', 'solve_seconds': 30}],
+        scenario
+    ))
+
+
+def test_balance_is_summed_across_providers():
+    async def scenario(stand_ins, providers):
+        solver = server.HedgedCaptchaSolver(providers)
+        assert await solver.get_balance() == pytest.approx(3.0)
+
+    asyncio.run(run_with_stand_ins([{'name': 'a'}, {'name': 'b'}], scenario))
+
+
+def test_duplicate_provider_names_are_rejected():
+    providers = [server.CaptchaSolver('key', name='same'), server.CaptchaSolver('key', name='same')]
+    with pytest.raises(ValueError):
+        server.HedgedCaptchaSolver(providers)
+
+
+def test_captcha_provider_is_abstract():
+    with pytest.raises(TypeError):
+        server.CaptchaProvider()
@@ -0,0 +1,97 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import server
+
+TAX_INFO = {"taxID": "0100109106", "name": "Cong ty ABC"}
+WITH_CONTACT = {"email": "lienhe@abc.vn", "phone": "0241234567", "phone_source": "pdf"}
+
+
+class FakeDb:
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.queries = []
+
+    def get_company_info(self, keyword=None):
+        self.queries.append(keyword)
+        return self.rows
+
+
+def row(age, contact_info=None):
+    updated_at = datetime.now(timezone.utc).replace(tzinfo=None) - age
+    return {
+        "updated_at": updated_at.isoformat() + "Z",
+        "raw_data": {"tax_info": TAX_INFO, "contact_info": contact_info or {}}
+    }
+
+
+def make_cache(rows=()):
+    return server.CompanyInfoCache(FakeDb(rows), ttl_seconds=24 * 3600, max_entries=2, miss_ttl_seconds=3600)
+
+
+def test_fresh_database_row_is_served_then_kept_in_memory():
+    cache = make_cache([row(timedelta(hours=5), WITH_CONTACT)])
+
+    first = asyncio.run(cache.get("Cong ty ABC"))
+    second = asyncio.run(cache.get("  cong ty   abc "))
+
+    assert first["cache"]["source"] == "database"
+    assert second["cache"]["source"] == "memory"
+    assert second["keyword"] == "  cong ty   abc "
+    assert second["contact_info"] == WITH_CONTACT
+    assert len(cache.db.queries) == 1
+
+
+def test_row_older_than_ttl_is_a_miss():
+    cache = make_cache([row(timedelta(hours=25), WITH_CONTACT)])
+
+    assert asyncio.run(cache.get("Cong ty ABC")) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_newest_row_wins():
+    older = row(timedelta(hours=20), {"email": "cu@abc.vn"})
+    newer = row(timedelta(hours=1), {"email": "moi@abc.vn"})
+    cache = make_cache([older, newer])
+
+    assert asyncio.run(cache.get("Cong ty ABC"))["contact_info"] == {"email": "moi@abc.vn"}
+
+
+def test_row_without_contact_uses_the_shorter_miss_ttl():
+    recent = make_cache([row(timedelta(minutes=10))])
+    stale = make_cache([row(timedelta(hours=2))])
+    masothue_phone_only = make_cache([row(timedelta(hours=2), {"phone": "0241234567", "phone_source": "masothue"})])
+
+    assert asyncio.run(recent.get("Cong ty ABC"))["cache"]["source"] == "database"
+    assert asyncio.run(stale.get("Cong ty ABC")) is None
+    assert asyncio.run(masothue_phone_only.get("Cong ty ABC")) is None
+
+
+def test_expired_memory_entry_falls_back_to_database():
+    cache = make_cache()
+    cache.put("Cong ty ABC", {"keyword": "Cong ty ABC", "tax_info": TAX_INFO, "contact_info": WITH_CONTACT, "status": "success"})
+    assert asyncio.run(cache.get("Cong ty ABC"))["cache"]["source"] == "memory"
+
+    key = server.normalize_keyword("Cong ty ABC")
+    updated_at, payload = cache._entries[key]
+    cache._entries[key] = (updated_at - timedelta(hours=25), payload)
+
+    assert asyncio.run(cache.get("Cong ty ABC")) is None
+    assert key not in cache._entries
+    assert cache.db.queries == ["Cong ty ABC"]
+
+
+def test_result_without_contact_is_not_cached():
+    cache = make_cache()
+    cache.put("Cong ty ABC", {"keyword": "Cong ty ABC", "tax_info": TAX_INFO, "contact_info": {}, "status": "success"})
+
+    assert asyncio.run(cache.get("Cong ty ABC")) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_memory_is_bounded_by_max_entries():
+    cache = make_cache()
+    for name in ["A", "B", "C"]:
+        cache.put(name, {"keyword": name, "tax_info": TAX_INFO, "contact_info": WITH_CONTACT, "status": "success"})
+
+    assert list(cache._entries) == ["b", "c"]
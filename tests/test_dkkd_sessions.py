@@ -0,0 +1,136 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+import server
+
+
+class FakeBrowser:
+    pass
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+
+
+class FakeBrowserPool:
+    """Chỉ phần BrowserPool mà DkkdSessionPool dùng: browser đang active và listener khi retire"""
+    def __init__(self):
+        self.active = FakeBrowser()
+        self.listeners = []
+
+    def add_retire_listener(self, callback):
+        self.listeners.append(callback)
+
+    def owns_active(self, browser):
+        return browser is self.active
+
+    def retire(self):
+        old, self.active = self.active, FakeBrowser()
+        for callback in self.listeners:
+            callback(type("Pooled", (), {"browser": old})())
+
+
+@pytest.fixture
+def contexts(monkeypatch):
+    """Context crawl giả, mở trên browser active hiện tại của FakeBrowserPool"""
+    pool = FakeBrowserPool()
+    opened = []
+
+    @asynccontextmanager
+    async def fake_open_crawl_context():
+        context = FakeContext(pool.active)
+        opened.append(context)
+        try:
+            yield context
+        finally:
+            context.closed = True
+
+    monkeypatch.setattr(server, "browser_pool", pool)
+    monkeypatch.setattr(server, "open_crawl_context", fake_open_crawl_context)
+    return pool, opened
+
+
+async def use(sessions, started=None, release=None):
+    async with sessions.acquire() as session:
+        if started is not None:
+            started.append(session)
+        if release:
+            await release.wait()
+        return session
+
+
+def test_concurrent_crawls_are_not_capped_by_idle_size(contexts):
+    async def scenario():
+        sessions = server.DkkdSessionPool(max_idle=1)
+        started, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(use(sessions, started, release)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        assert len(started) == 3
+        assert sessions.stats()["in_use"] == 3
+        release.set()
+        await asyncio.gather(*tasks)
+
+        # Chỉ giữ lại một session rảnh, hai context còn lại trả về browser pool
+        assert sessions.stats()["idle"] == 1
+        assert sessions.stats()["in_use"] == 0
+        assert [context.closed for context in opened].count(False) == 1
+
+    _, opened = contexts
+    asyncio.run(scenario())
+
+
+def test_idle_session_is_reused(contexts):
+    async def scenario():
+        sessions = server.DkkdSessionPool(max_idle=2)
+        first = await use(sessions)
+        second = await use(sessions)
+        return sessions, first, second
+
+    sessions, first, second = asyncio.run(scenario())
+
+    assert first is second
+    assert (sessions.created, sessions.reused) == (1, 1)
+
+
+def test_idle_sessions_on_a_retired_browser_are_closed(contexts):
+    pool, opened = contexts
+
+    async def scenario():
+        sessions = server.DkkdSessionPool(max_idle=2, sweep_interval=60)
+        await sessions.start()
+        try:
+            await use(sessions)
+            pool.retire()
+            # Listener đánh thức vòng sweep ngay, không chờ sweep_interval
+            await asyncio.sleep(0.01)
+            assert opened[0].closed
+            assert sessions.stats()["idle"] == 0
+
+            await use(sessions)
+            assert len(opened) == 2 and opened[1].browser is pool.active
+        finally:
+            await sessions.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failed_lookup_discards_the_session(contexts):
+    _, opened = contexts
+
+    async def scenario():
+        sessions = server.DkkdSessionPool(max_idle=2)
+        with pytest.raises(RuntimeError):
+            async with sessions.acquire():
+                raise RuntimeError("page crashed")
+        return sessions
+
+    sessions = asyncio.run(scenario())
+
+    assert sessions.discarded == 1
+    assert sessions.stats()["idle"] == 0
+    assert opened[0].closed
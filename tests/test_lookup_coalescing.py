@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+@pytest.fixture
+def isolated_lookups(monkeypatch, make_admission):
+    """admission/flight/cache riêng cho từng test, lookup nguồn được thay bằng coroutine đếm số lần chạy"""
+    calls = []
+
+    async def fake_lookup(keyword, on_progress=None, keyword_mst=None):
+        calls.append(keyword)
+        await asyncio.sleep(0.2)
+        return {"keyword": keyword, "tax_info": {"taxID": "0100109106"}, "status": "success"}, 200
+
+    async def no_cache(keyword):
+        return None
+
+    monkeypatch.setattr(server, "admission", make_admission(capacity=1))
+    monkeypatch.setattr(server, "lookup_flights", server.SingleFlight())
+    monkeypatch.setattr(server.company_cache, "get", no_cache)
+    monkeypatch.setattr(server, "_lookup_combined_info", fake_lookup)
+    return calls
+
+
+def test_single_flight_shares_one_call():
+    async def scenario():
+        flights = server.SingleFlight()
+        runs = []
+
+        async def work():
+            runs.append(1)
+            await asyncio.sleep(0.05)
+            return "done"
+
+        results = await asyncio.gather(*(flights.do("key", work) for _ in range(5)))
+        assert results == ["done"] * 5
+        assert len(runs) == 1
+        assert flights.stats() == {"in_flight": 0, "started": 1, "coalesced": 4}
+
+    asyncio.run(scenario())
+
+
+def test_single_flight_keeps_running_until_every_caller_leaves():
+    async def scenario():
+        flights = server.SingleFlight()
+        finished = asyncio.Event()
+
+        async def work():
+            await asyncio.sleep(0.1)
+            finished.set()
+            return "done"
+
+        first = asyncio.create_task(flights.do("key", work))
+        second = asyncio.create_task(flights.do("key", work))
+        await asyncio.sleep(0.01)
+
+        first.cancel()
+        assert await second == "done"
+        assert finished.is_set()
+
+        third = asyncio.create_task(flights.do("other", work))
+        await asyncio.sleep(0.01)
+        third.cancel()
+        await asyncio.gather(third, return_exceptions=True)
+        assert flights.stats()["in_flight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_coalesced_callers_do_not_hold_admission_slots(isolated_lookups):
+    async def scenario():
+        results = await asyncio.gather(*(
+            server.get_combined_info_internal(keyword) for keyword in ["Cong ty ABC", "cong ty abc", "CONG TY ABC"]
+        ))
+
+        # Capacity 1: nếu mỗi caller giữ một slot thì hai caller sau đã bị xếp hàng hoặc từ chối
+        assert [status for _, status in results] == [200, 200, 200]
+        assert [result["keyword"] for result, _ in results] == ["Cong ty ABC", "cong ty abc", "CONG TY ABC"]
+        assert len(isolated_lookups) == 1
+        assert server.admission.stats()["admitted"][server.PRIORITY_INTERACTIVE] == 1
+        assert server.admission.in_use == 0
+
+    asyncio.run(scenario())
+
+
+def test_bulk_callers_do_not_join_an_interactive_flight(isolated_lookups):
+    async def scenario():
+        results = await asyncio.gather(
+            server.get_combined_info_internal("Cong ty ABC"),
+            server.get_combined_info_internal("Cong ty ABC", priority=server.PRIORITY_BULK, reject=False)
+        )
+
+        assert [status for _, status in results] == [200, 200]
+        assert len(isolated_lookups) == 2
+
+    asyncio.run(scenario())
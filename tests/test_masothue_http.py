@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+from aiohttp import web
+
+import server
+
+SEARCH_BOX = '<form action="/Search/" method="get"><input type="hidden" name="token" value="t1"><input name="q"></form>'
+DETAIL_PAGE = SEARCH_BOX + """
+<table class="table-taxinfo">
+  <thead><tr><th itemprop="name"><span class="copy" title="CONG TY ABC">CONG TY ABC</span></th></tr></thead>
+  <tbody><tr><td>Mã số thuế</td><td><span class="copy">0100109106</span></td></tr></tbody>
+</table>
+"""
+# Trang không có bảng: kết quả theo từng query
+RESPONSES = {
+    "detail": (200, DETAIL_PAGE),
+    "listing": (200, SEARCH_BOX + '<div class="tax-listing"><h3><a href="/0100109106">CONG TY ABC</a></h3></div>'),
+    "expired-token": (419, "Page expired"),
+    "server-error": (500, "error"),
+    "changed-layout": (200, "<html><body>Trang mới</body></html>"),
+}
+
+
+async def run_with_stand_in(scenario):
+    homepage_hits = []
+
+    async def homepage(request):
+        homepage_hits.append(1)
+        return web.Response(text=SEARCH_BOX, content_type="text/html")
+
+    async def search(request):
+        status, body = RESPONSES[request.query["q"]]
+        return web.Response(status=status, text=body, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/", homepage)
+    app.router.add_get("/Search/", search)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    client = server.MasothueHttpClient(base_url=f"http://{host}:{port}")
+    try:
+        await scenario(client, homepage_hits)
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+async def search_raises(client, keyword, error):
+    with pytest.raises(error):
+        await client.search(keyword)
+
+
+def test_detail_page_is_parsed_and_form_reused():
+    async def scenario(client, homepage_hits):
+        first = await client.search("detail")
+        second = await client.search("detail")
+
+        assert first == second == {"companyName": "CONG TY ABC", "taxID": "0100109106"}
+        assert len(homepage_hits) == 1
+
+    asyncio.run(run_with_stand_in(scenario))
+
+
+@pytest.mark.parametrize("keyword, error", [
+    ("listing", server.MasothueNoDetailError),
+    ("server-error", server.MasothueHttpError),
+])
+def test_normal_non_detail_responses_keep_the_form(keyword, error):
+    async def scenario(client, homepage_hits):
+        await search_raises(client, keyword, error)
+        await client.search("detail")
+
+        assert len(homepage_hits) == 1
+
+    asyncio.run(run_with_stand_in(scenario))
+
+
+@pytest.mark.parametrize("keyword, error", [
+    ("expired-token", server.MasothueHttpError),
+    ("changed-layout", server.MasothueLayoutError),
+])
+def test_token_rejection_and_layout_change_reload_the_form(keyword, error):
+    async def scenario(client, homepage_hits):
+        await search_raises(client, keyword, error)
+        await client.search("detail")
+
+        assert len(homepage_hits) == 2
+
+    asyncio.run(run_with_stand_in(scenario))
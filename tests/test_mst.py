@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+import server
+
+
+@pytest.mark.parametrize("keyword, expected", [
+    ("0100109106", "0100109106"),
+    ("  0301036401 ", "0301036401"),
+    ("0100109106-001", "0100109106-001"),
+    ("0100109106001", "0100109106-001"),
+])
+def test_valid_mst_is_normalized(keyword, expected):
+    assert server.parse_mst(keyword) == expected
+
+
+@pytest.mark.parametrize("keyword", ["Cong ty ABC", "010010910", "01001091061", "0100109106-01", "0100109106 001"])
+def test_non_mst_keywords_are_not_parsed(keyword):
+    assert server.parse_mst(keyword) is None
+
+
+@pytest.mark.parametrize("keyword", ["0100109107", "0100109105-002"])
+def test_wrong_check_digit_is_rejected(keyword):
+    with pytest.raises(server.InvalidMSTError, match="checksum"):
+        server.parse_mst(keyword)
+
+
+def test_check_digit_ten_is_never_valid():
+    # Tổng mod 11 = 0 cho chữ số kiểm tra 10, không MST nào hợp lệ với 9 chữ số đầu này
+    base = "000000000"
+    assert 10 - sum(int(d) * w for d, w in zip(base, server.MST_CHECKSUM_WEIGHTS)) % 11 == 10
+    for last in "0123456789":
+        with pytest.raises(server.InvalidMSTError):
+            server.parse_mst(base + last)
+
+
+@pytest.mark.parametrize("keyword", ["0100109106-000", "0100109106000"])
+def test_branch_000_is_rejected(keyword):
+    with pytest.raises(server.InvalidMSTError, match="branch"):
+        server.parse_mst(keyword)
+
+
+def test_invalid_mst_is_rejected_before_any_lookup(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("lookup must not run for an invalid MST")
+
+    monkeypatch.setattr(server.company_cache, "get", fail)
+    monkeypatch.setattr(server, "_lookup_combined_info", fail)
+
+    result, status_code = asyncio.run(server.get_combined_info_internal("0100109107"))
+
+    assert status_code == 400
+    assert "checksum" in result["error"]
@@ -0,0 +1,83 @@
+import itertools
+
+import pytest
+
+import server
+
+CONTACT = {"phone": "024 3825 1234", "email": "lienhe@congtyabc.vn"}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """last_used tăng dần qua mỗi lần đọc/ghi để thứ tự LRU không phụ thuộc độ phân giải đồng hồ"""
+    ticks = itertools.count(1000)
+    monkeypatch.setattr(server.time, "time", lambda: float(next(ticks)))
+
+
+def make_cache(tmp_path, version="v1", max_bytes=1 << 20):
+    return server.PdfExtractionCache(str(tmp_path / "pdf_cache.sqlite3"), max_bytes, version)
+
+
+def test_put_then_get_round_trips(tmp_path):
+    cache = make_cache(tmp_path)
+    digest = cache.digest(b"%PDF-1.4 same bytes")
+
+    assert cache.get(digest) is None
+    cache.put(digest, CONTACT)
+
+    assert cache.get(cache.digest(b"%PDF-1.4 same bytes")) == CONTACT
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+    cache.close()
+
+
+def test_results_are_keyed_by_extractor_version(tmp_path):
+    old = make_cache(tmp_path, version="v1")
+    new = make_cache(tmp_path, version="v2")
+    digest = old.digest(b"%PDF")
+    old.put(digest, CONTACT)
+
+    assert new.get(digest) is None
+    new.put(digest, {"email": "lienhe@congtyabc.vn"})
+    assert old.get(digest) == CONTACT
+    assert new.get(digest) == {"email": "lienhe@congtyabc.vn"}
+    old.close()
+    new.close()
+
+
+def test_extractor_version_follows_extraction_config(monkeypatch):
+    version = server.pdf_extractor_version()
+
+    monkeypatch.setattr(server, "PDF_EXTRACT_MAX_PAGES", server.PDF_EXTRACT_MAX_PAGES + 1)
+    assert server.pdf_extractor_version() != version
+    monkeypatch.undo()
+
+    monkeypatch.setattr(server, "PDF_EXTRACT_TIERED", not server.PDF_EXTRACT_TIERED)
+    assert server.pdf_extractor_version() != version
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, clock):
+    cache = make_cache(tmp_path)
+    digests = [cache.digest(bytes([n])) for n in range(3)]
+    cache.put(digests[0], CONTACT)
+    entry_size = cache.stats()["bytes"]
+    cache.max_bytes = entry_size * 2
+
+    cache.put(digests[1], CONTACT)
+    # Đọc lại entry đầu để entry thứ hai thành entry lâu không dùng nhất
+    assert cache.get(digests[0]) == CONTACT
+    cache.put(digests[2], CONTACT)
+
+    assert cache.get(digests[1]) is None
+    assert cache.get(digests[0]) == CONTACT
+    assert cache.get(digests[2]) == CONTACT
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] <= cache.max_bytes
+    cache.close()
+
+
+def test_zero_max_bytes_disables_the_cache(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=0)
+    cache.put("digest", CONTACT)
+
+    assert cache.get("digest") is None
+    assert not (tmp_path / "pdf_cache.sqlite3").exists()
@@ -0,0 +1,44 @@
+import pytest
+
+import pdf_contact_extractor as extractor
+from tests.pdf_fixtures import make_pdf, registration_pdf
+
+
+@pytest.fixture
+def rendered_pages(monkeypatch):
+    """Đếm số trang đã được layout"""
+    pages = []
+    render_page_text = extractor.render_page_text
+
+    def counting_render(page_layout):
+        pages.append(page_layout.pageid)
+        return render_page_text(page_layout)
+
+    monkeypatch.setattr(extractor, "render_page_text", counting_render)
+    return pages
+
+
+def test_stops_after_the_page_with_phone_and_email(rendered_pages):
+    contact_info = extractor.extract_contact_info_incremental(registration_pdf(contact_page=2, pages=6))
+
+    assert contact_info["email"] == "lienhe@congtyabc.vn"
+    assert contact_info["phone"].strip() == "024 3825 1234"
+    assert len(rendered_pages) == 2
+
+
+def test_max_pages_limits_the_layout(rendered_pages):
+    contact_info = extractor.extract_contact_info_incremental(registration_pdf(contact_page=4, pages=6), max_pages=2)
+
+    assert contact_info == {}
+    assert len(rendered_pages) == 2
+
+
+@pytest.mark.parametrize("contact_page", [1, 3, 5])
+def test_matches_whole_file_extraction(contact_page):
+    pdf = registration_pdf(contact_page=contact_page, pages=5)
+
+    assert extractor.extract_contact_info_incremental(pdf) == extractor.scan_contact_info(extractor.extract_text_pdfminer(pdf))
+
+
+def test_pdf_without_text_returns_none():
+    assert extractor.extract_contact_info_incremental(make_pdf([[], []])) is None
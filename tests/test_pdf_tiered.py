@@ -0,0 +1,114 @@
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pdf_contact_extractor as extractor
+import server
+from tests.pdf_fixtures import make_pdf, registration_pdf
+
+
+@pytest.fixture
+def scripted_passes(monkeypatch):
+    """Thay pass pdfminer bằng kết quả định sẵn cho từng tier"""
+    results = {}
+    calls = []
+
+    def fake_pass(pdf_source, tier=extractor.PDF_TIER_FULL, incremental=True, max_pages=0):
+        calls.append(tier)
+        result = results[tier]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(extractor, "extract_contact_info_pass", fake_pass)
+    return results, calls
+
+
+def test_fast_pass_is_enough_for_a_simple_pdf():
+    contact_info, passes = extractor.extract_pdf_contact_info_tiered(registration_pdf(contact_page=2, pages=3))
+
+    assert contact_info["email"] == "lienhe@congtyabc.vn"
+    assert [(tier, found) for tier, found, _ in passes] == [(extractor.PDF_TIER_FAST, True)]
+
+
+def test_full_pass_wins_when_passes_disagree(scripted_passes):
+    results, calls = scripted_passes
+    results[extractor.PDF_TIER_FAST] = {"phone": "0241234567"}
+    results[extractor.PDF_TIER_FULL] = {"phone": "0987654321", "email": "lienhe@abc.vn"}
+
+    contact_info, passes = extractor.extract_pdf_contact_info_tiered(b"%PDF")
+
+    # Hai pass khác nhau ở phone: pass đầy đủ thắng
+    assert contact_info == {"phone": "0987654321", "email": "lienhe@abc.vn"}
+    assert [(tier, found) for tier, found, _ in passes] == [(extractor.PDF_TIER_FAST, False), (extractor.PDF_TIER_FULL, True)]
+
+
+def test_fast_pass_fields_are_kept_when_full_pass_misses_them(scripted_passes):
+    results, calls = scripted_passes
+    results[extractor.PDF_TIER_FAST] = {"phone": "0241234567"}
+    results[extractor.PDF_TIER_FULL] = {"phone": "", "email": "lienhe@abc.vn"}
+
+    contact_info, _ = extractor.extract_pdf_contact_info_tiered(b"%PDF")
+
+    assert contact_info == {"phone": "0241234567", "email": "lienhe@abc.vn"}
+
+
+def test_failed_fast_pass_falls_through_to_full_pass(scripted_passes):
+    results, calls = scripted_passes
+    results[extractor.PDF_TIER_FAST] = Exception("layout error")
+    results[extractor.PDF_TIER_FULL] = {"email": "lienhe@abc.vn"}
+
+    assert extractor.extract_pdf_contact_info(b"%PDF") == {"email": "lienhe@abc.vn"}
+    assert calls == [extractor.PDF_TIER_FAST, extractor.PDF_TIER_FULL]
+
+
+def test_tiering_disabled_runs_only_the_full_pass(scripted_passes):
+    results, calls = scripted_passes
+    results[extractor.PDF_TIER_FULL] = {}
+
+    assert extractor.extract_pdf_contact_info(b"%PDF", tiered=False) == {}
+    assert calls == [extractor.PDF_TIER_FULL]
+
+
+def test_pdf_without_text_returns_none():
+    contact_info, passes = extractor.extract_pdf_contact_info_tiered(make_pdf([[]]))
+
+    assert contact_info is None
+    assert [tier for tier, _, _ in passes] == [extractor.PDF_TIER_FAST, extractor.PDF_TIER_FULL]
+
+
+def test_tier_stats_hit_rate():
+    stats = server.PdfTierStats()
+    stats.record([(extractor.PDF_TIER_FAST, False, 0.01), (extractor.PDF_TIER_FULL, True, 0.03)])
+    stats.record([(extractor.PDF_TIER_FAST, True, 0.01)])
+
+    assert stats.stats()[extractor.PDF_TIER_FAST]["hit_rate"] == 0.5
+    assert stats.stats()[extractor.PDF_TIER_FULL]["runs"] == 1
+
+
+def test_worker_does_not_import_the_app():
+    # Worker spawn của PdfExtractionService chỉ cần module extractor, không kéo theo server.py
+    code = (
+        "import sys, pdf_contact_extractor; "
+        "assert 'server' not in sys.modules and 'fastapi' not in sys.modules and 'pyodbc' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+
+def test_extraction_runs_in_the_process_pool():
+    async def scenario():
+        service = server.PdfExtractionService(workers=1, timeout=60)
+        try:
+            return await service.run(
+                extractor.extract_pdf_contact_info_tiered, registration_pdf(contact_page=1, pages=2), True, True, 0
+            )
+        finally:
+            service.close()
+
+    contact_info, passes = asyncio.run(scenario())
+
+    assert contact_info["email"] == "lienhe@congtyabc.vn"
+    assert passes[0][0] == extractor.PDF_TIER_FAST